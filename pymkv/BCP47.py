@@ -1,10 +1,16 @@
 import warnings
 from functools import cache
 
-import bcp47
-
 
 @cache
+def _bcp47_languages() -> frozenset[str]:
+    # bcp47 loads its registry on import, so defer it until a tag is actually checked.
+    import bcp47
+
+    # "und" (undetermined) is accepted by mkvmerge but is not part of the bcp47 registry.
+    return frozenset(bcp47.languages.values()) | {"und"}
+
+
 def is_bcp47(language_ietf: str) -> bool:
     """
     Check if a given language tag is a valid BCP 47 language tag.
@@ -24,7 +30,4 @@ def is_bcp47(language_ietf: str) -> bool:
         category=DeprecationWarning,
         stacklevel=2,
     )
-    if language_ietf != "und":
-        return language_ietf in bcp47.languages.values()
-    else:  # noqa: RET505
-        return True
+    return language_ietf in _bcp47_languages()
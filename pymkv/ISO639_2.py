@@ -1,8 +1,17 @@
 from __future__ import annotations
 
-from iso639 import Language, LanguageNotFoundError
+from functools import cache, lru_cache
 
 
+@cache
+def _iso639_2_codes() -> frozenset[str]:
+    # iso639 loads its whole language registry on import, so defer it until a code is actually checked.
+    from iso639 import ALL_LANGUAGES
+
+    return frozenset(lang.part2b for lang in ALL_LANGUAGES if lang.part2b)
+
+
+@lru_cache(maxsize=512)
 def is_iso639_2(language: str) -> bool:
     """
     Parameters
@@ -15,8 +24,4 @@ def is_iso639_2(language: str) -> bool:
     bool
         True if the language code is valid according to ISO 639-2, False otherwise.
     """
-    try:
-        Language.from_part2b(language)
-        return True  # noqa: TRY300
-    except LanguageNotFoundError:
-        return False
+    return isinstance(language, str) and language.strip() in _iso639_2_codes()
@@ -26,8 +26,32 @@ Now, the MKV can be muxed with both attachments.
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from mimetypes import guess_type
-from pathlib import Path
+
+from pymkv.utils import expand_path
+
+
+@lru_cache(maxsize=256)
+def _guess_mime_type(suffixes: str) -> str | None:
+    # mimetypes only looks at the extensions, so the result can be shared by every file with the same suffixes.
+    return guess_type(f"attachment{suffixes}")[0]
+
+
+def _file_suffixes(file_path: str) -> str:
+    # every suffix, not just the last one, since mimetypes reads compound ones such as .tar.gz
+    name = os.path.basename(file_path).lstrip(".")  # noqa: PTH119
+    dot = name.find(".")
+    return name[dot:] if dot != -1 else ""
+
+
+def _expand_attachment_path(file_path: str) -> str:
+    fp = expand_path(file_path)
+    if not os.path.isfile(fp):  # noqa: PTH113
+        msg = f'"{fp}" does not exist'
+        raise FileNotFoundError(msg)
+    return fp
 
 
 class MKVAttachment:
@@ -44,6 +68,8 @@ class MKVAttachment:
     attach_once : bool, optional
         Determines if the attachment should be added to all split files or only the first. Default is False,
         which will attach to all files.
+    mime_type : str, optional
+        The attachment's MIME type. If not given, it will be guessed from the file extension.
 
     Attributes
     ----------
@@ -58,16 +84,22 @@ class MKVAttachment:
         which will attach to all files.
     """
 
+    __slots__ = ["_file_path", "attach_once", "description", "mime_type", "name"]
+
     def __init__(
         self,
         file_path: str,
         name: str | None = None,
         description: str | None = None,
         attach_once: bool | None = False,
+        mime_type: str | None = None,
     ) -> None:
-        self.mime_type: str | None = None
+        self.mime_type: str | None = mime_type
         self._file_path: str
-        self.file_path = file_path
+        if mime_type is None:
+            self.file_path = file_path
+        else:
+            self._file_path = _expand_attachment_path(file_path)
         self.name = name
         self.description = description
         self.attach_once = attach_once
@@ -80,9 +112,9 @@ class MKVAttachment:
             self (object): The object for which the string representation is generated.
 
         Returns:
-            str: The string representation of the object. It is the representation of the object's __dict__ attribute.
+            str: The string representation of the object. It is the representation of a dict of the object's slots.
         """
-        return repr(self.__dict__)
+        return repr({slot: getattr(self, slot) for slot in self.__slots__})
 
     @property
     def file_path(self) -> str:
@@ -112,10 +144,7 @@ class MKVAttachment:
         -------
         None
         """
-        fp = Path(file_path).expanduser()
-        if not fp.is_file():
-            msg = f'"{fp}" does not exist'
-            raise FileNotFoundError(msg)
-        self.mime_type = guess_type(fp)[0]
+        fp = _expand_attachment_path(file_path)
+        self.mime_type = _guess_mime_type(_file_suffixes(fp))
         self.name = None
-        self._file_path = str(fp)
+        self._file_path = fp
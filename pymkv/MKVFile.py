@@ -40,26 +40,42 @@ from __future__ import annotations
 import logging
 import os
 import subprocess as sp
-from collections.abc import Iterable, Sequence
-from pathlib import Path
-from typing import Any, TypeVar, cast
-
-import bitmath
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from itertools import islice
+from typing import IO, TYPE_CHECKING, Any, TypeVar, cast
 
 from pymkv.ISO639_2 import is_iso639_2
 from pymkv.MKVAttachment import MKVAttachment
 from pymkv.MKVTrack import MKVTrack
 from pymkv.Timestamp import Timestamp
-from pymkv.utils import prepare_mkvtoolnix_path
+from pymkv.utils import expand_path, map_concurrently, prepare_mkvtoolnix_path
 from pymkv.Verifications import (
     checking_file_path,
-    get_file_info,
+    get_cached_file_info,
     verify_mkvmerge,
     verify_supported,
 )
 
+if TYPE_CHECKING:
+    import bitmath
+
 T = TypeVar("T")
 
+# mkvmerge track properties that are copied onto the MKVTrack attribute of the same name
+_TRACK_PROPERTIES = (
+    "track_name",
+    "language",
+    "language_ietf",
+    "default_track",
+    "forced_track",
+    "flag_commentary",
+    "flag_hearing_impaired",
+    "flag_visual_impaired",
+    "flag_original",
+)
+_MISSING = object()
+
 
 class MKVFile:
     """
@@ -96,6 +112,24 @@ class MKVFile:
         Raised if the path to mkvmerge could not be verified.
     """
 
+    __slots__ = [
+        "_batch_depth",
+        "_chapter_language",
+        "_chapters_file",
+        "_global_tag_entries",
+        "_global_tags_file",
+        "_info_json",
+        "_link_to_next_file",
+        "_link_to_previous_file",
+        "_number_file",
+        "_split_options",
+        "attachments",
+        "mkvmerge_path",
+        "no_track_statistics_tags",
+        "title",
+        "tracks",
+    ]
+
     def __init__(
         self,
         file_path: str | os.PathLike | None = None,
@@ -114,6 +148,7 @@ class MKVFile:
         self._number_file = 0
         self._info_json: dict[str, Any] | None = None
         self._global_tag_entries = 0
+        self._batch_depth = 0
 
         # exclusions
         self.no_track_statistics_tags = False
@@ -129,11 +164,7 @@ class MKVFile:
             # add file title
             file_path = checking_file_path(file_path)
             try:
-                info_json = get_file_info(
-                    file_path,
-                    self.mkvmerge_path,
-                    check_path=False,
-                )
+                info_json = get_cached_file_info(file_path, self.mkvmerge_path)
                 self._info_json = info_json
             except sp.CalledProcessError as e:
                 error_output = e.output.decode()
@@ -142,46 +173,35 @@ class MKVFile:
                     e.cmd,
                     output=error_output,
                 ) from e
-            if self.title is None and "title" in info_json["container"]["properties"]:
-                self.title = info_json["container"]["properties"]["title"]
+            if self.title is None:
+                self.title = info_json["container"]["properties"].get("title")
 
             self._global_tag_entries = sum(t["num_entries"] for t in info_json.get("global_tags", []))
 
             # dictionary associating track_id to the number of tag entries:
             track_tag_entries: dict[int, int] = {
-                t["track_id"]: t["num_entries"] for t in self._info_json.get("track_tags", [])
+                t["track_id"]: t["num_entries"] for t in info_json.get("track_tags", [])
             }
 
             # add tracks with info
-            for track in info_json["tracks"]:
-                track_id = track["id"]
-                new_track = MKVTrack(
-                    file_path,
-                    track_id=track_id,
-                    mkvmerge_path=self.mkvmerge_path,
-                    existing_info=self._info_json,
-                    tag_entries=track_tag_entries.get(track_id, 0),
-                )
-                if "track_name" in track["properties"]:
-                    new_track.track_name = track["properties"]["track_name"]
-                if "language" in track["properties"]:
-                    new_track.language = track["properties"]["language"]
-                if "language_ietf" in track["properties"]:
-                    new_track.language_ietf = track["properties"]["language_ietf"]
-                if "default_track" in track["properties"]:
-                    new_track.default_track = track["properties"]["default_track"]
-                if "forced_track" in track["properties"]:
-                    new_track.forced_track = track["properties"]["forced_track"]
-                if "flag_commentary" in track["properties"]:
-                    new_track.flag_commentary = track["properties"]["flag_commentary"]
-                if "flag_hearing_impaired" in track["properties"]:
-                    new_track.flag_hearing_impaired = track["properties"]["flag_hearing_impaired"]
-                if "flag_visual_impaired" in track["properties"]:
-                    new_track.flag_visual_impaired = track["properties"]["flag_visual_impaired"]
-                if "flag_original" in track["properties"]:
-                    new_track.flag_original = track["properties"]["flag_original"]
-
-                self.add_track(new_track, new_file=False)
+            mkvmerge_path = self.mkvmerge_path
+            with self.batch_edits():
+                for track in info_json["tracks"]:
+                    track_id = track["id"]
+                    new_track = MKVTrack(
+                        file_path,
+                        track_id=track_id,
+                        mkvmerge_path=mkvmerge_path,
+                        existing_info=info_json,
+                        tag_entries=track_tag_entries.get(track_id, 0),
+                    )
+                    get_property = track["properties"].get
+                    for name in _TRACK_PROPERTIES:
+                        value = get_property(name, _MISSING)
+                        if value is not _MISSING:
+                            setattr(new_track, name, value)
+
+                    self.add_track(new_track, new_file=False)
 
         # split options
         self._split_options: list[str] = []
@@ -191,9 +211,44 @@ class MKVFile:
         Return a string representation of the MKVFile object.
 
         Returns:
-            str: A string representation of the object's attributes.
+            str: A string representation of the object's slots.
         """
-        return repr(self.__dict__)
+        return repr({slot: getattr(self, slot) for slot in self.__slots__})
+
+    @classmethod
+    def open_many(
+        cls,
+        file_paths: Iterable[str | os.PathLike],
+        mkvmerge_path: str | os.PathLike | Iterable[str] = "mkvmerge",
+        max_workers: int | None = None,
+    ) -> list[MKVFile]:
+        """
+        Import several pre-existing MKV files concurrently, using :func:`~pymkv.utils.map_concurrently`.
+
+        Parameters
+        ----------
+        file_paths : iterable of str or os.PathLike
+            Paths to the MKV files to import.
+        mkvmerge_path : str, optional
+            The path where pymkv looks for the mkvmerge executable.
+        max_workers : int, optional
+            The maximum number of files imported at the same time. Defaults to half the CPU count. Lower it for
+            files on spinning disks, where concurrent reads compete for the same drive head.
+
+        Returns
+        -------
+        list of :class:`~pymkv.MKVFile`
+            The imported files, in the same order as `file_paths`.
+
+        Raises
+        ------
+        FileNotFoundError
+            Raised if the path to mkvmerge could not be verified or a file does not exist.
+        ValueError
+            Raised if a file is not a valid Matroska file or is not supported.
+        """
+        mkvmerge_path = prepare_mkvtoolnix_path(mkvmerge_path)
+        return map_concurrently(lambda file_path: cls(file_path, mkvmerge_path=mkvmerge_path), file_paths, max_workers)
 
     @property
     def chapter_language(self) -> str | None:
@@ -234,9 +289,9 @@ class MKVFile:
         """
         return self._global_tag_entries
 
-    def command(  # noqa: PLR0912,PLR0915
+    def command(
         self,
-        output_path: str,
+        output_path: str | os.PathLike,
         subprocess: bool = False,
     ) -> str | list:
         """
@@ -244,7 +299,7 @@ class MKVFile:
 
         Parameters
         ----------
-        output_path : str
+        output_path : str, os.PathLike
             The path to be used as the output file in the mkvmerge command.
         subprocess : bool
             Will return the command as a list so it can be used easily with the :mod:`subprocess` module.
@@ -255,7 +310,7 @@ class MKVFile:
             The full command to mux the :class:`~pymkv.MKVFile` as a string containing spaces. Will be returned as a
             list of strings with no spaces if `subprocess` is True.
         """
-        output_path = str(Path(output_path).expanduser())
+        output_path = expand_path(output_path)
         command = [*self.mkvmerge_path, "-o", output_path]
         if self.title is not None:
             command.extend(["--title", self.title])
@@ -266,71 +321,7 @@ class MKVFile:
         for track in self.tracks:
             # for track_order
             track_order.append(f"{track.file_id}:{track.track_id}")
-            # flags
-            if track.track_name is not None:
-                command.extend(
-                    ["--track-name", f"{track.track_id!s}:{track.track_name}"],
-                )
-            if track.language_ietf is not None:
-                command.extend(
-                    ["--language", f"{track.track_id!s}:{track.language_ietf}"],
-                )
-            elif track.language is not None:
-                command.extend(["--language", f"{track.track_id!s}:{track.language}"])
-            if track.sync is not None:
-                command.extend(["--sync", f"{track.track_id!s}:{track.sync}"])
-            if track.tags is not None:
-                command.extend(["--tags", f"{track.track_id!s}:{track.tags}"])
-            if track.default_track:
-                command.extend(["--default-track", f"{track.track_id!s}:1"])
-            else:
-                command.extend(["--default-track", f"{track.track_id!s}:0"])
-            if track.forced_track:
-                command.extend(["--forced-track", f"{track.track_id!s}:1"])
-            else:
-                command.extend(["--forced-track", f"{track.track_id!s}:0"])
-            if track.flag_hearing_impaired:
-                command.extend(["--hearing-impaired-flag", f"{track.track_id!s}:1"])
-            else:
-                command.extend(["--hearing-impaired-flag", f"{track.track_id!s}:0"])
-            if track.flag_visual_impaired:
-                command.extend(["--visual-impaired-flag", f"{track.track_id!s}:1"])
-            else:
-                command.extend(["--visual-impaired-flag", f"{track.track_id!s}:0"])
-            if track.flag_original:
-                command.extend(["--original-flag", f"{track.track_id!s}:1"])
-            else:
-                command.extend(["--original-flag", f"{track.track_id!s}:0"])
-            if track.flag_commentary:
-                command.extend(["--commentary-flag", f"{track.track_id!s}:1"])
-            else:
-                command.extend(["--commentary-flag", f"{track.track_id!s}:0"])
-            if track.compression is not None:
-                command.extend(
-                    ["--compression", f"{track.track_id!s}:{'zlib' if track.compression else 'none'}"],
-                )
-
-            # remove extra tracks
-            if track.track_type == "audio":
-                command.append("-D")
-                command.extend(["-a", str(track.track_id), "-S"])
-            elif track.track_type == "subtitles":
-                command.extend(("-D", "-A", "-s", str(track.track_id)))
-            elif track.track_type == "video":
-                command.extend(["-d", str(track.track_id), "-A", "-S"])
-            else:
-                command.extend(("-D", "-A", "-S"))
-            # exclusions
-            if track.no_chapters:
-                command.append("--no-chapters")
-            if track.no_global_tags:
-                command.append("--no-global-tags")
-            if track.no_track_tags:
-                command.append("--no-track-tags")
-            if track.no_attachments:
-                command.append("--no-attachments")
-
-            command.append(track.file_path)
+            command += self._track_command(track)
 
         # add attachments
         for attachment in self.attachments:
@@ -373,6 +364,82 @@ class MKVFile:
 
         return command if subprocess else " ".join(command)
 
+    @staticmethod
+    def _track_command(track: MKVTrack) -> list[str]:
+        """
+        Generates the part of the mkvmerge command for a single :class:`~pymkv.MKVTrack`.
+
+        Parameters
+        ----------
+        track : :class:`~pymkv.MKVTrack`
+            The track to generate the options and source file for.
+
+        Returns
+        -------
+        list of str
+            The track's options followed by its file path.
+        """
+        tid = str(track.track_id)
+        prefix = f"{tid}:"
+        flag_on = f"{prefix}1"
+        flag_off = f"{prefix}0"
+        command: list[str] = []
+        # flags
+        track_name = track.track_name
+        if track_name is not None:
+            command += ("--track-name", f"{prefix}{track_name}")
+        language = track.language_ietf
+        if language is None:
+            language = track.language
+        if language is not None:
+            command += ("--language", f"{prefix}{language}")
+        sync = track.sync
+        if sync is not None:
+            command += ("--sync", f"{prefix}{sync}")
+        tags = track.tags
+        if tags is not None:
+            command += ("--tags", prefix + tags)
+        command += (
+            "--default-track",
+            flag_on if track.default_track else flag_off,
+            "--forced-track",
+            flag_on if track.forced_track else flag_off,
+            "--hearing-impaired-flag",
+            flag_on if track.flag_hearing_impaired else flag_off,
+            "--visual-impaired-flag",
+            flag_on if track.flag_visual_impaired else flag_off,
+            "--original-flag",
+            flag_on if track.flag_original else flag_off,
+            "--commentary-flag",
+            flag_on if track.flag_commentary else flag_off,
+        )
+        compression = track.compression
+        if compression is not None:
+            command += ("--compression", prefix + ("zlib" if compression else "none"))
+
+        # remove extra tracks
+        track_type = track.track_type
+        if track_type == "audio":
+            command += ("-D", "-a", tid, "-S")
+        elif track_type == "subtitles":
+            command += ("-D", "-A", "-s", tid)
+        elif track_type == "video":
+            command += ("-d", tid, "-A", "-S")
+        else:
+            command += ("-D", "-A", "-S")
+        # exclusions
+        if track.no_chapters:
+            command.append("--no-chapters")
+        if track.no_global_tags:
+            command.append("--no-global-tags")
+        if track.no_track_tags:
+            command.append("--no-track-tags")
+        if track.no_attachments:
+            command.append("--no-attachments")
+
+        command.append(track.file_path)
+        return command
+
     def mux(self, output_path: str | os.PathLike, silent: bool = False, ignore_warning: bool = False) -> int:
         """
         Mixes the specified :class:`~pymkv.MKVFile`.
@@ -399,14 +466,21 @@ class MKVFile:
             or issues with output file writing. The error message provides details about
             the failure based on the output of the command.
         """
-        output_path = str(Path(output_path).expanduser())
         args = self.command(output_path, subprocess=True)
 
         stdout = sp.DEVNULL if silent else None
         stderr = sp.PIPE
 
         proc = sp.Popen(args, stdout=stdout, stderr=stderr)  # noqa: S603
-        _, err = proc.communicate()
+        # stderr is the only pipe, so it can be read line by line as mkvmerge writes it without risking a deadlock
+        err_lines = []
+        with cast(IO[bytes], proc.stderr) as proc_stderr:
+            for line in proc_stderr:
+                err_lines.append(line)
+                if not silent:
+                    logging.debug(line.decode(errors="replace").rstrip())
+        proc.wait()
+        err = b"".join(err_lines)
 
         if proc.returncode != 0:
             # Handle warnings (exit code 1) if ignore_warning is True
@@ -445,19 +519,20 @@ class MKVFile:
         """
         if isinstance(file, (str, os.PathLike)):
             self._number_file += 1
-            new_tracks = MKVFile(file).tracks
+            # same mkvmerge path, so the probe results cached by get_cached_file_info are reused
+            new_tracks = MKVFile(file, mkvmerge_path=self.mkvmerge_path).tracks
             for track in new_tracks:
                 track.file_id = self._number_file
-            self.tracks = self.tracks + new_tracks
+            self.tracks.extend(new_tracks)
         elif isinstance(file, MKVFile):
             self._number_file += 1
             for track in file.tracks:
                 track.file_id = self._number_file
-            self.tracks = self.tracks + file.tracks
+            self.tracks.extend(file.tracks)
         else:
             msg = "track is not str or MKVFile"
             raise TypeError(msg)
-        self.order_tracks_by_file_id()
+        self._reorder_tracks()
 
     def add_track(self, track: str | MKVTrack, new_file: bool = True) -> None:
         """
@@ -488,7 +563,7 @@ class MKVFile:
         else:
             msg = "track is not str or MKVTrack"
             raise TypeError(msg)
-        self.order_tracks_by_file_id()
+        self._reorder_tracks()
 
     def _extracted_from_add_track(
         self,
@@ -558,8 +633,10 @@ class MKVFile:
         if not 0 <= track_num < len(self.tracks):
             msg = "track index out of range"
             raise IndexError(msg)
+        if track_num == 0:
+            return
         self.tracks.insert(0, self.tracks.pop(track_num))
-        self.order_tracks_by_file_id()
+        self._reorder_tracks()
 
     def move_track_end(self, track_num: int) -> None:
         """
@@ -578,8 +655,10 @@ class MKVFile:
         if not 0 <= track_num < len(self.tracks):
             msg = "track index out of range"
             raise IndexError(msg)
+        if track_num == len(self.tracks) - 1:
+            return
         self.tracks.append(self.tracks.pop(track_num))
-        self.order_tracks_by_file_id()
+        self._reorder_tracks()
 
     def move_track_forward(self, track_num: int) -> None:
         """
@@ -602,7 +681,7 @@ class MKVFile:
             self.tracks[track_num + 1],
             self.tracks[track_num],
         )
-        self.order_tracks_by_file_id()
+        self._reorder_tracks()
 
     def move_track_backward(self, track_num: int) -> None:
         """
@@ -625,7 +704,7 @@ class MKVFile:
             self.tracks[track_num - 1],
             self.tracks[track_num],
         )
-        self.order_tracks_by_file_id()
+        self._reorder_tracks()
 
     def swap_tracks(self, track_num_1: int, track_num_2: int) -> None:
         """
@@ -652,7 +731,7 @@ class MKVFile:
             self.tracks[track_num_2],
             self.tracks[track_num_1],
         )
-        self.order_tracks_by_file_id()
+        self._reorder_tracks()
 
     def replace_track(self, track_num: int, track: MKVTrack) -> None:
         """
@@ -674,7 +753,7 @@ class MKVFile:
             msg = "track index out of range"
             raise IndexError(msg)
         self.tracks[track_num] = track
-        self.order_tracks_by_file_id()
+        self._reorder_tracks()
 
     def remove_track(self, track_num: int) -> None:
         """
@@ -694,12 +773,15 @@ class MKVFile:
             msg = "track index out of range"
             raise IndexError(msg)
         del self.tracks[track_num]
-        self.order_tracks_by_file_id()
+        self._reorder_tracks()
 
     def split_none(self) -> None:
         """Remove all splitting options."""
         self._split_options = []
 
+    def _set_split_options(self, split: str, link: bool | None) -> None:
+        self._split_options = ["--split", split, "--link"] if link else ["--split", split]
+
     def split_size(
         self,
         size: bitmath.Bitmath | int,
@@ -721,14 +803,13 @@ class MKVFile:
         TypeError
             Raised if if `size` is not a bitmath object or an integer.
         """
-        if getattr(size, "__module__", None) == bitmath.__name__:
-            size = cast(bitmath.Bitmath, size).bytes
+        # compare the module name so bitmath itself never has to be imported
+        if getattr(size, "__module__", None) == "bitmath":
+            size = cast("bitmath.Bitmath", size).bytes
         elif not isinstance(size, int):
             msg = "size is not a bitmath object or integer"
             raise TypeError(msg)
-        self._split_options = ["--split", f"size:{size}"]
-        if link:
-            self._split_options.append("--link")
+        self._set_split_options(f"size:{size}", link)
 
     def split_duration(self, duration: str | int, link: bool | None = False) -> None:
         """
@@ -742,9 +823,7 @@ class MKVFile:
         link : bool, optional
             Determines if the split files should be linked together after splitting.
         """
-        self._split_options = ["--split", f"duration:{Timestamp(duration)!s}"]
-        if link:
-            self._split_options.append("--link")
+        self._set_split_options(f"duration:{Timestamp(duration)!s}", link)
 
     def split_timestamps(
         self,
@@ -776,18 +855,15 @@ class MKVFile:
         if None in ts_flat:
             msg = f'"{timestamps}" are not properly formatted timestamps'
             raise ValueError(msg)
-        for ts_1, ts_2 in zip(ts_flat[:-1], ts_flat[1:], strict=False):
-            if Timestamp(ts_1) >= Timestamp(ts_2):
+        ts_objs = [Timestamp(ts) for ts in ts_flat]
+        for ts_1, ts_2 in zip(ts_objs, islice(ts_objs, 1, None)):
+            if ts_1 >= ts_2:
                 msg = f'"{timestamps}" are not properly formatted timestamps'
                 raise ValueError(msg)
 
         # build ts_string from timestamps
-        ts_string = "timestamps:"
-        for ts in ts_flat:
-            ts_string += f"{Timestamp(ts)!s},"
-        self._split_options = ["--split", ts_string[:-1]]
-        if link:
-            self._split_options.append("--link")
+        ts_string = "timestamps:" + ",".join([str(ts) for ts in ts_objs])
+        self._set_split_options(ts_string, link)
 
     def split_frames(
         self,
@@ -817,22 +893,20 @@ class MKVFile:
         if not frames_flat:
             msg = f'"{frames}" are not properly formatted frames'
             raise ValueError(msg)
+
+        # validate and build f_string from frames in a single pass
+        f_strs: list[str] = []
+        previous: int | None = None
         for f in frames_flat:
             if not isinstance(f, int):
                 msg = f'frame "{f}" not an int'
                 raise TypeError(msg)
-        for f_1, f_2 in zip(frames_flat[:-1], frames_flat[1:], strict=False):
-            if f_1 >= f_2:
+            if previous is not None and previous >= f:
                 msg = f'"{frames}" are not properly formatted frames'
                 raise ValueError(msg)
-
-        # build f_string from frames
-        f_string = "frames:"
-        for f in frames_flat:
-            f_string += f"{f!s},"
-        self._split_options = ["--split", f_string[:-1]]
-        if link:
-            self._split_options.append("--link")
+            f_strs.append(str(f))
+            previous = f
+        self._set_split_options("frames:" + ",".join(f_strs), link)
 
     def split_timestamp_parts(
         self,
@@ -854,42 +928,37 @@ class MKVFile:
         Raises
         ------
         TypeError
-            Raised if any of the timestamp sets are not a list or tuple.
+            Raised if any of the timestamps are not of type str or int.
         ValueError
             Raised if `timestamp_parts` contains improperly formatted parts.
         """
-        ts_flat: list[str | int | Timestamp] = MKVFile.flatten(timestamp_parts)
+        ts_sets: list[list[str | int | Timestamp]] = [MKVFile.flatten(ts_set) for ts_set in timestamp_parts]
+        ts_flat = [ts for ts_set in ts_sets for ts in ts_set]
         if not ts_flat:
             msg = f'"{timestamp_parts}" are not properly formatted parts'
             raise ValueError(msg)
 
-        if None in ts_flat[1:-1]:
+        # only the very first and last timestamps may be open-ended
+        if any(ts_flat[i] is None for i in range(1, len(ts_flat) - 1)):
             msg = f'"{timestamp_parts}" are not properly formatted parts'
             raise ValueError(msg)
 
-        for ts_1, ts_2 in zip(ts_flat[:-1], ts_flat[1:], strict=False):
-            if None not in (ts_1, ts_2) and Timestamp(ts_1) >= Timestamp(ts_2):
+        ts_objs = [None if ts is None else Timestamp(ts) for ts in ts_flat]
+        for ts_1, ts_2 in zip(ts_objs, islice(ts_objs, 1, None)):
+            if ts_1 is not None and ts_2 is not None and ts_1 >= ts_2:
                 msg = f'"{timestamp_parts}" are not properly formatted parts'
                 raise ValueError(msg)
 
-        ts_string = "parts:"
-        for ts_set in timestamp_parts:
-            ts_set = MKVFile.flatten(ts_set)  # noqa: PLW2901
-            if not isinstance(ts_set, (list, tuple)):
-                msg = "set is not of type list or tuple"
-                raise TypeError(msg)
+        set_strs: list[str] = []
+        position = 0
+        for ts_set in ts_sets:
             if len(ts_set) < 2 or len(ts_set) % 2 != 0:  # noqa: PLR2004
                 msg = f'"{ts_set}" is not a properly formatted set'
                 raise ValueError(msg)
-            for index, ts in enumerate(ts_set):
-                if index % 2 == 0 and index > 0:
-                    ts_string += "+"
-                if ts is not None:
-                    ts_string += str(Timestamp(ts))
-                ts_string += "-" if index % 2 == 0 else ","
-        self._split_options = ["--split", ts_string[:-1]]
-        if link:
-            self._split_options.append("--link")
+            ts_strs = ["" if ts is None else str(ts) for ts in ts_objs[position : position + len(ts_set)]]
+            position += len(ts_set)
+            set_strs.append(",+".join([f"{start}-{end}" for start, end in zip(ts_strs[::2], ts_strs[1::2])]))
+        self._set_split_options("parts:" + ",".join(set_strs), link)
 
     def split_parts_frames(
         self,
@@ -912,42 +981,39 @@ class MKVFile:
         Raises
         ------
         TypeError
-            Raised if any of the frame sets are not a list or tuple.
+            Raised if any of the frames are not of type int.
         ValueError
             Raised if `frame_parts` contains improperly formatted parts.
         """
-        f_flat: list[int] = MKVFile.flatten(frame_parts)
+        f_sets: list[list[int]] = [MKVFile.flatten(f_set) for f_set in frame_parts]
+        f_flat = [f for f_set in f_sets for f in f_set]
         if not f_flat:
             msg = f'"{frame_parts}" are not properly formatted parts'
             raise ValueError(msg)
-        if None in f_flat[1:-1]:
+        # only the very first and last frames may be open-ended
+        if any(f_flat[i] is None for i in range(1, len(f_flat) - 1)):
             msg = f'"{frame_parts}" are not properly formatted parts'
             raise ValueError(msg)
-        for f_1, f_2 in zip(f_flat[:-1], f_flat[1:], strict=False):
-            if None not in (f_1, f_2) and f_1 >= f_2:
+        for f_1, f_2 in zip(f_flat, islice(f_flat, 1, None)):
+            if f_1 is not None and f_2 is not None and f_1 >= f_2:
                 msg = f'"{frame_parts}" are not properly formatted parts'
                 raise ValueError(msg)
-        f_string = "parts:"
-        for fp in frame_parts:
-            f_set = MKVFile.flatten(fp)
-            if not isinstance(f_set, (list, tuple)):
-                msg = "set is not of type list or tuple"
-                raise TypeError(msg)
+        set_strs: list[str] = []
+        for f_set in f_sets:
             if len(f_set) < 2 or len(f_set) % 2 != 0:  # noqa: PLR2004
                 msg = f'"{f_set}" is not a properly formatted set'
                 raise ValueError(msg)
-            for index, f in enumerate(f_set):
-                if not isinstance(f, int) and f is not None:
+            f_strs: list[str] = []
+            for f in f_set:
+                if f is None:
+                    f_strs.append("")
+                elif isinstance(f, int):
+                    f_strs.append(str(f))
+                else:
                     msg = f'frame "{f}" not an int'
                     raise TypeError(msg)
-                if index % 2 == 0 and index > 0:
-                    f_string += "+"
-                if f is not None:
-                    f_string += str(f)
-                f_string += "-" if index % 2 == 0 else ","
-        self._split_options = ["--split", f_string[:-1]]
-        if link:
-            self._split_options.append("--link")
+            set_strs.append(",+".join([f"{start}-{end}" for start, end in zip(f_strs[::2], f_strs[1::2])]))
+        self._set_split_options("parts:" + ",".join(set_strs), link)
 
     def split_chapters(
         self,
@@ -976,23 +1042,19 @@ class MKVFile:
         if not chapters:
             self._split_options = ["--split", "chapters:all"]
             return
+        c_strs: list[str] = []
+        previous = 0
         for c in c_flat:
             if not isinstance(c, int):
                 msg = f'chapter "{c}" not an int'
                 raise TypeError(msg)
-            if c < 1:
+            # chapters start at 1 and must be strictly increasing
+            if c <= previous:
                 msg = f'"{chapters}" are not properly formatted chapters'
                 raise ValueError(msg)
-        for c_1, c_2 in zip(c_flat[:-1], c_flat[1:], strict=False):
-            if c_1 >= c_2:
-                msg = f'"{chapters}" are not properly formatted chapters'
-                raise ValueError(msg)
-        c_string = "chapters:"
-        for c in c_flat:
-            c_string += f"{c!s},"
-        self._split_options = ["--split", c_string[:-1]]
-        if link:
-            self._split_options.append("--link")
+            c_strs.append(str(c))
+            previous = c
+        self._set_split_options("chapters:" + ",".join(c_strs), link)
 
     def link_to_previous(self, file_path: str) -> None:
         """
@@ -1108,15 +1170,23 @@ class MKVFile:
         if not track_ids:
             msg = f'"{track_ids}" are not properly formatted track ids'
             raise ValueError(msg)
+        tracks = self.tracks
+        track_count = len(tracks)
         for tid in ids_flat:
             if not isinstance(tid, int):
                 msg = f'track id "{tid}" not an int'
                 raise TypeError(msg)
-            if tid < 0 or tid >= len(self.tracks):
+            if not 0 <= tid < track_count:
                 msg = "track id out of range"
                 raise IndexError(msg)
-        for tid in ids_flat if exclusive else list(set(range(len(self.tracks))) - set(ids_flat)):
-            self.tracks[tid].no_track_tags = True
+        if exclusive:
+            for tid in ids_flat:
+                tracks[tid].no_track_tags = True
+        else:
+            ids_set = frozenset(ids_flat)
+            for tid in range(track_count):
+                if tid not in ids_set:
+                    tracks[tid].no_track_tags = True
 
     def no_chapters(self) -> None:
         """
@@ -1181,15 +1251,52 @@ class MKVFile:
         list
             A flattened version of `item`.
         """
-
-        def _flatten(item: T | Iterable[T | Iterable[T]]) -> Iterable[T]:
-            if isinstance(item, Sequence) and not isinstance(item, str):
-                for subitem in item:
-                    yield from _flatten(subitem)
+        # fast path for the common case of a flat run of ints, such as ``split_chapters(1, 5, 10)``
+        if type(item) in (list, tuple) and all(type(subitem) is int for subitem in cast(Sequence[Any], item)):
+            return list(cast(Sequence[T], item))
+
+        flat: list[T] = []
+        # walk the nesting with an explicit stack instead of recursive generators, pushing children in reverse so
+        # they are popped in their original order
+        stack: list[Any] = [item]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, (list, tuple)) or (isinstance(current, Sequence) and not isinstance(current, str)):
+                stack.extend(reversed(current))
             else:
-                yield cast(T, item)
+                flat.append(current)
+        return flat
+
+    @contextmanager
+    def batch_edits(self) -> Iterator[None]:
+        """
+        Group several track edits so file IDs are only reassigned once.
+
+        Every method that adds, removes or moves tracks normally calls
+        :meth:`~pymkv.MKVFile.order_tracks_by_file_id` afterwards. Inside this context manager that step is
+        skipped and performed once on exit instead. Contexts may be nested; the file IDs are reassigned when the
+        outermost one exits.
 
-        return list(_flatten(item))
+        Examples
+        --------
+        Add several tracks and reassign the file IDs once at the end::
+
+            mkv = MKVFile()
+            with mkv.batch_edits():
+                for path in ("/path/to/track.h264", "/path/to/track.aac"):
+                    mkv.add_track(path)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.order_tracks_by_file_id()
+
+    def _reorder_tracks(self) -> None:
+        if not self._batch_depth:
+            self.order_tracks_by_file_id()
 
     def order_tracks_by_file_id(self) -> None:
         """
@@ -1202,12 +1309,5 @@ class MKVFile:
         This method modifies the file_id attribute of each track in self.tracks.
         """
         unique_file_dict: dict[str, int] = {}
-        try:
-            for track in self.tracks:
-                if track.file_path not in unique_file_dict:
-                    unique_file_dict[track.file_path] = len(unique_file_dict)
-
-            for track in self.tracks:
-                track.file_id = unique_file_dict[track.file_path]
-        except KeyError as e:
-            raise ValueError from e
+        for track in self.tracks:
+            track.file_id = unique_file_dict.setdefault(track.file_path, len(unique_file_dict))
@@ -41,17 +41,34 @@ from __future__ import annotations
 
 import os
 import subprocess as sp
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from pymkv.ISO639_2 import is_iso639_2
-from pymkv.utils import prepare_mkvtoolnix_path
-from pymkv.Verifications import checking_file_path, get_file_info, verify_supported
+from pymkv.utils import expand_path, map_concurrently, prepare_mkvtoolnix_path
+from pymkv.Verifications import checking_file_path, get_cached_file_info, verify_supported
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
 
+def _run_mkvextract(
+    mkvextract_path: tuple[str, ...],
+    file_path: str,
+    track_args: list[str],
+    silent: bool | None,
+) -> None:
+    command = [*mkvextract_path, "tracks", file_path, *track_args]
+    if silent:
+        sp.run(  # noqa: S603
+            command,
+            stdout=sp.DEVNULL,
+            check=True,
+        )
+    else:
+        # let mkvextract write its progress straight to the terminal instead of buffering it in memory
+        sp.run(command, check=True)  # noqa: S603
+
+
 class MKVTrack:
     """A class that represents a track for an :class:`~pymkv.MKVFile` object.
     :class:`~pymkv.MKVTrack` objects are video, audio, or subtitles. Tracks can be standalone files or a single track
@@ -85,6 +102,9 @@ class MKVTrack:
         The path where pymkv looks for the mkvextract executable. pymkv relies on the mkvextract executable to extract
         files. By default, it is assumed mkvextract is in your shell's $PATH variable. If it is not, you need to set
         *mkvextract_path* to the executable location.
+    existing_info : dict, optional
+        The ``mkvmerge -J`` identification of `file_path`, if the caller already has it. When its ``file_name``
+        matches `file_path`, it is trusted as is and mkvmerge is not run again to verify or identify the file.
     tag_entries : int, optional
         The number of tag entries.
     compression : bool, optional
@@ -122,6 +142,36 @@ class MKVTrack:
         that are already part of an MKV file.
     """
 
+    __slots__ = [
+        "_file_id",
+        "_file_path",
+        "_info_json",
+        "_language",
+        "_language_ietf",
+        "_pts",
+        "_sync",
+        "_tag_entries",
+        "_tags",
+        "_track_codec",
+        "_track_id",
+        "_track_type",
+        "compression",
+        "default_track",
+        "extension",
+        "flag_commentary",
+        "flag_hearing_impaired",
+        "flag_original",
+        "flag_visual_impaired",
+        "forced_track",
+        "mkvextract_path",
+        "mkvmerge_path",
+        "no_attachments",
+        "no_chapters",
+        "no_global_tags",
+        "no_track_tags",
+        "track_name",
+    ]
+
     def __init__(  # noqa: PLR0913
         self,
         file_path: str,
@@ -152,9 +202,8 @@ class MKVTrack:
         self.mkvmerge_path = prepare_mkvtoolnix_path(mkvmerge_path)
         self._info_json: dict[str, Any] | None = existing_info or None
         self._file_path: str
-        self.file_path = file_path
         self._track_id: int
-        self.track_id = track_id
+        self._set_source(file_path, track_id)
         self._file_id = 0
         self._pts = 0
 
@@ -191,9 +240,73 @@ class MKVTrack:
         Return a string representation of the MKVTrack object.
 
         Returns:
-            str: A string representation of the object's dictionary.
+            str: A string representation of the object's slots, without the mkvmerge identification of the whole
+            file.
+        """
+        return repr({slot: getattr(self, slot) for slot in self.__slots__ if slot != "_info_json"})
+
+    @classmethod
+    def from_mkv(
+        cls,
+        file_path: str,
+        track_ids: Iterable[int] | None = None,
+        mkvmerge_path: str | os.PathLike | Iterable[str] = "mkvmerge",
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[MKVTrack]:
+        """
+        Create a track object for several tracks of the same file.
+
+        The file is identified by mkvmerge once and every track is built from that shared result.
+
+        Args:
+            file_path (str): The path to the file containing the tracks.
+            track_ids (Iterable[int] | None, optional): The ids of the tracks to create. All tracks of the file
+            are created if not set.
+            mkvmerge_path (str | os.PathLike | Iterable[str], optional): The path of the mkvmerge executable.
+            **kwargs: Any other :class:`~pymkv.MKVTrack` argument, applied to every track.
+
+        Returns:
+            list[MKVTrack]: The tracks, in the order of `track_ids`.
+
+        Raises:
+            IndexError: If any of the track ids is out of range of the file's tracks.
+        """
+        info_json = get_cached_file_info(file_path, mkvmerge_path)
+        if track_ids is None:
+            track_ids = range(len(info_json.get("tracks", [])))
+        return [
+            cls(file_path, track_id=track_id, mkvmerge_path=mkvmerge_path, existing_info=info_json, **kwargs)
+            for track_id in track_ids
+        ]
+
+    @classmethod
+    def load_many(
+        cls,
+        file_paths: Iterable[str],
+        mkvmerge_path: str | os.PathLike | Iterable[str] = "mkvmerge",
+        max_workers: int | None = None,
+    ) -> list[list[MKVTrack]]:
+        """
+        Create the track objects for every track of several files concurrently.
+
+        Each file is loaded with :meth:`from_mkv`, in the same way as :meth:`~pymkv.MKVFile.open_many` imports files.
+
+        Args:
+            file_paths (Iterable[str]): The paths to the files containing the tracks.
+            mkvmerge_path (str | os.PathLike | Iterable[str], optional): The path of the mkvmerge executable.
+            max_workers (int | None, optional): The maximum number of files identified at the same time. Defaults
+            to half the CPU count, as in :meth:`~pymkv.MKVFile.open_many`.
+
+        Returns:
+            list[list[MKVTrack]]: The tracks of each file, in the same order as `file_paths`.
+
+        Raises:
+            ValueError: If a file is not a supported file type.
         """
-        return repr(self.__dict__)
+        mkvmerge_path = prepare_mkvtoolnix_path(mkvmerge_path)
+        return map_concurrently(
+            lambda file_path: cls.from_mkv(file_path, mkvmerge_path=mkvmerge_path), file_paths, max_workers
+        )
 
     @property
     def file_path(self) -> str:
@@ -222,12 +335,23 @@ class MKVTrack:
         Raises:
             ValueError: If the file is not a valid Matroska file or is not supported.
         """
+        self._set_source(file_path, 0)
+
+    def _set_source(self, file_path: str, track_id: int) -> None:
+        # validate the file and select the track in one go, so the identification is only looked up once
         fp = checking_file_path(file_path)
-        if not verify_supported(fp, mkvmerge_path=self.mkvmerge_path):
+        # identification passed in for a different file, or kept from before file_path changed, does not describe
+        # this one and has to be looked up again
+        info_json = self._info_json
+        if info_json is not None and info_json.get("file_name") != fp:
+            info_json = None
+        if not verify_supported(fp, mkvmerge_path=self.mkvmerge_path, info_json=info_json):
             msg = f"The file '{file_path}' is not a valid Matroska file or is not supported."
             raise ValueError(msg)
         self._file_path = fp
-        self.track_id = 0
+        # the cached lookup is free for the file verify_supported just checked
+        self._info_json = info_json or get_cached_file_info(fp, mkvmerge_path=self.mkvmerge_path)
+        self.track_id = track_id
 
     @property
     def file_id(self) -> int:
@@ -290,7 +414,7 @@ class MKVTrack:
             IndexError: If the passed in index is out of range of the file's tracks.
         """
         if not self._info_json:
-            self._info_json = get_file_info(self.file_path, mkvmerge_path=self.mkvmerge_path)
+            self._info_json = get_cached_file_info(self.file_path, mkvmerge_path=self.mkvmerge_path)
         tracks = self._info_json.get("tracks", [])
         if not 0 <= track_id < len(tracks):
             msg = "track index out of range"
@@ -435,11 +559,11 @@ class MKVTrack:
             msg = f'"{file_path}" is not of type str'
             raise TypeError(msg)
 
-        file_path = Path(file_path).expanduser()
-        if not file_path.is_file():
+        file_path = expand_path(file_path)
+        if not os.path.isfile(file_path):  # noqa: PTH113
             msg = f'"{file_path}" does not exist'
             raise FileNotFoundError(msg)
-        self._tags = str(file_path)
+        self._tags = file_path
 
     @property
     def tag_entries(self) -> int:
@@ -487,6 +611,45 @@ class MKVTrack:
         Returns:
             str: The path of the extracted file.
         """
+        output_path = self._extract_output_path(output_path)
+        _run_mkvextract(self.mkvextract_path, self.file_path, [f"{self.track_id}:{output_path}"], silent)
+        return output_path
+
+    @staticmethod
+    def extract_many(
+        tracks: Iterable[MKVTrack],
+        output_path: str | os.PathLike | None = None,
+        silent: bool | None = False,
+    ) -> list[str]:
+        """
+        Extract several tracks as files, reading each source file only once.
+
+        Tracks that come from the same file are extracted by a single mkvextract call, instead of one call per
+        track as with :meth:`~pymkv.MKVTrack.extract`.
+
+        Args:
+            tracks (Iterable[MKVTrack]): The tracks to extract.
+            output_path (str | os.PathLike | None, optional): The directory to extract the tracks to. By default
+            every track is extracted next to its source file.
+            silent (bool | None, optional): By default the mkvextract output will be shown unless silent is True.
+
+        Returns:
+            list[str]: The paths of the extracted files, in the order of `tracks`.
+        """
+        output_paths: list[str] = []
+        # group the tracks by source file, keeping the order in which each file is first seen
+        groups: dict[tuple[tuple[str, ...], str], list[str]] = {}
+        for track in tracks:
+            track_output_path = track._extract_output_path(output_path)  # noqa: SLF001
+            output_paths.append(track_output_path)
+            groups.setdefault((track.mkvextract_path, track.file_path), []).append(
+                f"{track.track_id}:{track_output_path}",
+            )
+        for (mkvextract_path, file_path), track_args in groups.items():
+            _run_mkvextract(mkvextract_path, file_path, track_args, silent)
+        return output_paths
+
+    def _extract_output_path(self, output_path: str | os.PathLike | None) -> str:
         extract_info_file = f"_[{self.track_id}]"
         if self.language:
             extract_info_file += f"_{self.language}"
@@ -496,23 +659,6 @@ class MKVTrack:
         if (not self.language and not self.extension) and self.track_name:
             extract_info_file += f"_{self.track_name}"
         if output_path is None:
-            output_path = f"{self.file_path}{extract_info_file}"
-        else:
-            file = Path(self.file_path)
-            output_path = Path(output_path, f"{file.name}{extract_info_file}")
-        output_path = str(Path(output_path).expanduser())
-        command = [
-            *self.mkvextract_path,
-            "tracks",
-            f"{self.file_path}",
-            f"{self.track_id}:{output_path}",
-        ]
-        if silent:
-            sp.run(  # noqa: S603
-                command,
-                stdout=sp.DEVNULL,
-                check=True,
-            )
-        else:
-            sp.run(command, check=True, capture_output=True)  # noqa: S603
-        return output_path
+            return expand_path(f"{self.file_path}{extract_info_file}")
+        file_name = os.path.basename(self.file_path)  # noqa: PTH119
+        return expand_path(os.path.join(output_path, f"{file_name}{extract_info_file}"))  # noqa: PTH118
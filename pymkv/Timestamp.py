@@ -1,11 +1,25 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Final, cast
 
 _TIMESTAMP_PATTERN: Final[re.Pattern] = re.compile(
     r"^[0-9]{1,2}(:[0-9]{1,2}){1,2}(\.[0-9]{1,9})?$",
 )
+_FORM_PATTERN: Final[re.Pattern] = re.compile(
+    r"^(([Hh]{1,2}):)?([Mm]{1,2}):([Ss]{1,2})(\.([Nn]{1,9}))?$",
+)
+
+
+@lru_cache(maxsize=64)
+def _form_fields(form: str) -> tuple[bool, ...]:
+    # which of hours, minutes, seconds and nanoseconds a form always shows; a Timestamp is mostly printed with a
+    # handful of forms, so each is only parsed once
+    format_match = _FORM_PATTERN.match(form)
+    assert format_match is not None
+    format_groups = format_match.groups()
+    return tuple(format_groups[i] is not None for i in (1, 2, 3, 5))
 
 
 class Timestamp:
@@ -73,7 +87,7 @@ class Timestamp:
         if not isinstance(other, Timestamp):
             return NotImplemented
 
-        return self.hh == other.hh and self.mm == other.mm and self.ss == other.ss and self.nn == other.nn
+        return (self._hh, self._mm, self._ss, self._nn) == (other._hh, other._mm, other._ss, other._nn)
 
     def __ne__(self, other: object) -> bool:
         """
@@ -87,7 +101,7 @@ class Timestamp:
         """
         if not isinstance(other, Timestamp):
             return NotImplemented
-        return self.hh != other.hh or self.mm != other.mm or self.ss != other.ss or self.nn != other.nn
+        return (self._hh, self._mm, self._ss, self._nn) != (other._hh, other._mm, other._ss, other._nn)
 
     def __lt__(self, other: object) -> bool:
         """
@@ -101,15 +115,7 @@ class Timestamp:
         """
         if not isinstance(other, Timestamp):
             return NotImplemented
-        if self.hh != other.hh:
-            return self.hh < other.hh
-        elif self.mm != other.mm:  # noqa: RET505
-            return self.mm < other.mm
-        elif self.ss != other.ss:
-            return self.ss < other.ss
-        elif self.nn != other.nn:
-            return self.nn < other.nn
-        return False
+        return (self._hh, self._mm, self._ss, self._nn) < (other._hh, other._mm, other._ss, other._nn)
 
     def __le__(self, other: object) -> bool:
         """
@@ -123,15 +129,7 @@ class Timestamp:
         """
         if not isinstance(other, Timestamp):
             return NotImplemented
-        if self.hh != other.hh:
-            return self.hh <= other.hh
-        elif self.mm != other.mm:  # noqa: RET505
-            return self.mm <= other.mm
-        elif self.ss != other.ss:
-            return self.ss <= other.ss
-        elif self.nn != other.nn:
-            return self.nn <= other.nn
-        return True
+        return (self._hh, self._mm, self._ss, self._nn) <= (other._hh, other._mm, other._ss, other._nn)
 
     def __gt__(self, other: object) -> bool:
         """
@@ -145,15 +143,7 @@ class Timestamp:
         """
         if not isinstance(other, Timestamp):
             return NotImplemented
-        if self.hh != other.hh:
-            return self.hh > other.hh
-        elif self.mm != other.mm:  # noqa: RET505
-            return self.mm > other.mm
-        elif self.ss != other.ss:
-            return self.ss > other.ss
-        elif self.nn != other.nn:
-            return self.nn > other.nn
-        return False
+        return (self._hh, self._mm, self._ss, self._nn) > (other._hh, other._mm, other._ss, other._nn)
 
     def __ge__(self, other: object) -> bool:
         """
@@ -167,15 +157,7 @@ class Timestamp:
         """
         if not isinstance(other, Timestamp):
             return NotImplemented
-        if self.hh != other.hh:
-            return self.hh >= other.hh
-        elif self.mm != other.mm:  # noqa: RET505
-            return self.mm >= other.mm
-        elif self.ss != other.ss:
-            return self.ss >= other.ss
-        elif self.nn != other.nn:
-            return self.nn >= other.nn
-        return True
+        return (self._hh, self._mm, self._ss, self._nn) >= (other._hh, other._mm, other._ss, other._nn)
 
     def __str__(self) -> str:
         return self.ts
@@ -190,7 +172,7 @@ class Timestamp:
         Returns:
             int: The element at the specified index.
         """
-        return (self.hh, self.mm, self.ss, self.ss)[index]
+        return cast(int, (self._hh, self._mm, self._ss, self._nn)[index])
 
     @property
     def ts(self) -> str:
@@ -205,13 +187,7 @@ class Timestamp:
         the timestamp string according to the specified format, including or omitting parts
         based on the format and the presence of non-zero values.
         """
-        format_match = re.match(
-            r"^(([Hh]{1,2}):)?([Mm]{1,2}):([Ss]{1,2})(\.([Nn]{1,9}))?$",
-            self.form,
-        )
-        assert format_match is not None
-        format_groups = format_match.groups()
-        timestamp_format = [format_groups[i] is not None for i in (1, 2, 3, 5)]
+        timestamp_format = _form_fields(self.form)
 
         timestamp_string = ""
         if timestamp_format[0] or self._hh:
@@ -221,7 +197,7 @@ class Timestamp:
         if timestamp_format[2] or self._ss:
             timestamp_string += f"{self.ss:0=2d}"
         if timestamp_format[3] or self._nn:
-            timestamp_string += f"{self.nn / 1000000000:.9f}".rstrip("0")[1:] if self.nn else ".0"
+            timestamp_string += f".{self.nn:09d}".rstrip("0") if self.nn else ".0"
         return timestamp_string
 
     @ts.setter
@@ -410,21 +386,14 @@ class Timestamp:
         The seconds (self.ss) will be set to 56.
         The nanoseconds (self.nn) will be set to 789012345.
         """
-        timestamp_match = re.match(
-            r"^(([0-9]{1,2}):)?([0-9]{1,2}):([0-9]{1,2})(\.([0-9]{1,9}))?$",
-            timestamp,
-        )
-        assert timestamp_match is not None
-        timestamp_groups = timestamp_match.groups()
-
-        timestamp_lst = [cast(str, timestamp_groups[i]) for i in (1, 2, 3, 4)]
-        timestamp_clean = []
-        for ts in timestamp_lst:
-            if ts is None:
-                timestamp_clean.append(0)
-            else:
-                timestamp_clean.append(float(ts))
-        self.hh = int(timestamp_clean[0]) if self._hh is None else self._hh
-        self.mm = int(timestamp_clean[1]) if self._mm is None else self._mm
-        self.ss = int(timestamp_clean[2]) if self._ss is None else self._ss
-        self.nn = int(timestamp_clean[3] * 1000000000) if self._nn is None else self._nn
+        # verify's "$" also matches before a trailing newline, which the old parsing regex ignored as well
+        whole, _, fraction = timestamp.removesuffix("\n").partition(".")
+        parts = whole.split(":")
+        hh = int(parts[0]) if len(parts) == 3 else 0  # noqa: PLR2004
+        mm, ss = int(parts[-2]), int(parts[-1])
+        # pad the fraction to nanoseconds instead of going through float, which can be off by one
+        nn = int(fraction.ljust(9, "0")) if fraction else 0
+        self.hh = hh if self._hh is None else self._hh
+        self.mm = mm if self._mm is None else self._mm
+        self.ss = ss if self._ss is None else self._ss
+        self.nn = nn if self._nn is None else self._nn
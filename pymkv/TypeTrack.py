@@ -76,6 +76,6 @@ def get_track_extension(track: MKVTrack) -> str | None:
     """
     track_type = track.track_type
     track_codec = track.track_codec
-    if track_type in type_files and track_codec in type_files[track_type]:
-        return type_files[track_type][track_codec]
-    return None
+    if track_type is None or track_codec is None:
+        return None
+    return type_files.get(track_type, {}).get(track_codec)
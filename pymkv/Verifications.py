@@ -41,15 +41,20 @@ See Also
 
 from __future__ import annotations
 
-import json
 import os
 import subprocess as sp
 from collections.abc import Iterable, Sequence
-from pathlib import Path
+from functools import lru_cache
 from re import match
 from typing import Any
 
-from pymkv.utils import prepare_mkvtoolnix_path
+from pymkv.utils import expand_path, prepare_mkvtoolnix_path
+
+try:
+    # orjson parses the mkvmerge output noticeably faster when it is installed
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads  # type: ignore[assignment]
 
 
 def checking_file_path(file_path: str | os.PathLike[Any] | None) -> str:
@@ -75,11 +80,11 @@ def checking_file_path(file_path: str | os.PathLike[Any] | None) -> str:
     if not isinstance(file_path, (str, os.PathLike)):
         msg = f'"{file_path}" is not of type str'
         raise TypeError(msg)
-    file_path = Path(file_path).expanduser()
-    if not file_path.is_file():
+    file_path = expand_path(file_path)
+    if not os.path.isfile(file_path):  # noqa: PTH113
         msg = f'"{file_path}" does not exist'
         raise FileNotFoundError(msg)
-    return str(file_path)
+    return file_path
 
 
 def get_file_info(
@@ -119,7 +124,61 @@ def get_file_info(
         file_path = checking_file_path(file_path)
 
     cmds = [*prepare_mkvtoolnix_path(mkvmerge_path), "-J", file_path]
-    return json.loads(sp.check_output(cmds).decode())  # noqa: S603
+    return json_loads(sp.check_output(cmds))  # noqa: S603
+
+
+@lru_cache(maxsize=128)
+def _cached_file_info(
+    file_path: str,
+    mkvmerge_path: tuple[str, ...],
+    mtime_ns: int,
+    size: int,
+    inode: int,
+) -> dict[str, Any]:
+    # mtime_ns, size and inode are only part of the cache key, so a rewritten or replaced file is probed again
+    return json_loads(sp.check_output([*mkvmerge_path, "-J", file_path]))  # noqa: S603
+
+
+def get_cached_file_info(
+    file_path: str | os.PathLike[Any],
+    mkvmerge_path: str | os.PathLike | Iterable[str],
+) -> dict[str, Any]:
+    """Get information about a media file using mkvmerge, reusing earlier results for the same file.
+
+    Results are cached per file path, mkvmerge path, file modification time, file size and inode, so repeated
+    lookups of an unchanged file only run mkvmerge once.
+
+    Parameters
+    ----------
+    file_path : str | os.PathLike[Any]
+        The path to the media file to analyze.
+    mkvmerge_path : str | os.PathLike | Iterable[str]
+        The path to the mkvmerge executable or a list of command parts.
+
+    Returns
+    -------
+    dict[str, Any]
+        A dictionary containing the parsed JSON output from mkvmerge. The dictionary is shared between
+        callers and must not be modified.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If mkvmerge fails to execute or returns a non-zero exit status.
+    FileNotFoundError
+        If the file does not exist.
+    TypeError
+        If file_path is not a string or PathLike object.
+    """
+    file_path = checking_file_path(file_path)
+    stat = os.stat(file_path)  # noqa: PTH116
+    return _cached_file_info(
+        file_path,
+        prepare_mkvtoolnix_path(mkvmerge_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        stat.st_ino,
+    )
 
 
 def verify_mkvmerge(
@@ -136,14 +195,30 @@ def verify_mkvmerge(
     -------
     bool
         True if mkvmerge is available at the specified path, False otherwise.
+
+    Notes
+    -----
+    A successful check is remembered for each mkvmerge path, so a working mkvmerge is only run once per path. A
+    failed check is not, so installing mkvmerge or fixing the path takes effect on the next call.
     """
+    return _verify_mkvmerge(prepare_mkvtoolnix_path(mkvmerge_path))
+
+
+# mkvmerge paths that have passed _verify_mkvmerge
+_verified_mkvmerge_paths: set[tuple[str, ...]] = set()
+
+
+def _verify_mkvmerge(mkvmerge_path: tuple[str, ...]) -> bool:
+    if mkvmerge_path in _verified_mkvmerge_paths:
+        return True
     try:
-        mkvmerge_command = list(prepare_mkvtoolnix_path(mkvmerge_path))
-        mkvmerge_command.append("-V")
-        output = sp.check_output(mkvmerge_command).decode()  # noqa: S603
+        output = sp.check_output([*mkvmerge_path, "-V"]).decode()  # noqa: S603
     except (sp.CalledProcessError, FileNotFoundError):
         return False
-    return bool(match("mkvmerge.*", output))
+    if not match("mkvmerge.*", output):
+        return False
+    _verified_mkvmerge_paths.add(mkvmerge_path)
+    return True
 
 
 def verify_matroska(
@@ -276,6 +351,7 @@ def verify_recognized(
 def verify_supported(
     file_path: str | os.PathLike[Any],
     mkvmerge_path: str | os.PathLike | Iterable[str] = "mkvmerge",
+    info_json: dict[str, Any] | None = None,
 ) -> bool:
     """Verify if the file format is supported by mkvmerge.
 
@@ -285,6 +361,9 @@ def verify_supported(
         The path to the file that will be verified.
     mkvmerge_path : str | os.PathLike | Iterable[str], optional
         The path to the mkvmerge executable. Defaults to "mkvmerge".
+    info_json : dict[str, Any], optional
+        The mkvmerge identification of the file, if the caller already has it. The file and mkvmerge are
+        not checked again when it is given.
 
     Returns
     -------
@@ -305,13 +384,12 @@ def verify_supported(
     This function checks if mkvmerge can fully support the container format of the specified file.
     A file might be recognized but not fully supported for all operations.
     """
-    mkvmerge_path = prepare_mkvtoolnix_path(mkvmerge_path)
-    fp = verify_file_path_and_mkvmerge(file_path, mkvmerge_path)
-    try:
-        if isinstance(mkvmerge_path, list):
-            mkvmerge_path = tuple(mkvmerge_path)
-        info_json = get_file_info(fp, mkvmerge_path, check_path=False)
-    except sp.CalledProcessError as e:
-        msg = f'"{file_path}" could not be opened'
-        raise ValueError(msg) from e
+    if info_json is None:
+        mkvmerge_path = prepare_mkvtoolnix_path(mkvmerge_path)
+        fp = verify_file_path_and_mkvmerge(file_path, mkvmerge_path)
+        try:
+            info_json = get_cached_file_info(fp, mkvmerge_path)
+        except sp.CalledProcessError as e:
+            msg = f'"{file_path}" could not be opened'
+            raise ValueError(msg) from e
     return info_json["container"]["supported"]
@@ -3,14 +3,81 @@ from __future__ import annotations
 import os
 import shlex
 from collections.abc import Iterable, Sequence
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, wraps
 from pathlib import Path
 from typing import Any, Callable, TypeVar, cast
 
 T = TypeVar("T")
+ItemType = TypeVar("ItemType")
 SelfType = TypeVar("SelfType")
 
 
+@cache
+def _shlex_split(path: str) -> tuple[str, ...]:
+    return tuple(shlex.split(path))
+
+
+def _split_mkvtoolnix_path(path: str) -> tuple[str, ...]:
+    # Check if the path exists and is accessible. This is asked again on every call, since the file may appear
+    # later or a relative path may be resolved from another working directory; only the splitting is cached.
+    return (path,) if Path(path).exists() else _shlex_split(path)
+
+
+def expand_path(path: str | os.PathLike[Any]) -> str:
+    """
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The path to expand.
+
+    Returns
+    -------
+    str
+        The path with a leading ``~`` expanded to the user's home directory.
+
+    Notes
+    -----
+    Only string operations are performed, so no :class:`~pathlib.Path` object is created for every call.
+    """
+    return os.path.expanduser(os.fspath(path))  # noqa: PTH111
+
+
+def map_concurrently(
+    func: Callable[[ItemType], T],
+    items: Iterable[ItemType],
+    max_workers: int | None = None,
+) -> list[T]:
+    """
+    Parameters
+    ----------
+    func : Callable
+        The function to call for every item.
+    items : Iterable
+        The items to call `func` with.
+    max_workers : int, optional
+        The maximum number of calls running at the same time. Defaults to half the CPU count, and is never more
+        than the number of items.
+
+    Returns
+    -------
+    list
+        The results of `func`, in the same order as `items`.
+
+    Notes
+    -----
+    Meant for calls that mostly wait on their own mkvtoolnix process, so they run on a thread pool rather than one
+    after another. Only half the CPUs are used by default, leaving the rest to those processes.
+    """
+    items = list(items)
+    if not items:
+        return []
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
 def prepare_mkvtoolnix_path(
     path: str | os.PathLike | Iterable[str],
 ) -> tuple[str, ...]:
@@ -33,8 +100,7 @@ def prepare_mkvtoolnix_path(
     if isinstance(path, os.PathLike):
         return (os.fspath(path),)
     elif isinstance(path, str):  # noqa: RET505
-        # Check if the path exists and is accessible
-        return (path,) if Path(path).exists() else tuple(shlex.split(path))
+        return _split_mkvtoolnix_path(path)
     elif isinstance(path, tuple):
         return path
     elif isinstance(path, Sequence):
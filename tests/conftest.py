@@ -1,9 +1,14 @@
+import json
 import random
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
+from pymkv import Verifications
+
 
 @pytest.fixture
 def get_base_path() -> Path:
@@ -33,6 +38,33 @@ def _cleanup_mkv_files(
                 file_path.unlink()
 
 
+@pytest.fixture(autouse=True)
+def _clear_mkvmerge_caches() -> None:
+    # mkvmerge results are cached for the whole process, so a faked mkvmerge must not leak into other tests
+    Verifications._verified_mkvmerge_paths.clear()  # noqa: SLF001
+    Verifications._cached_file_info.cache_clear()  # noqa: SLF001
+
+
+@pytest.fixture
+def fake_mkvmerge() -> Generator[dict[str, dict[str, Any]], None, None]:
+    """
+    Fixture that stands in for mkvmerge.
+
+    ``mkvmerge -V`` succeeds and ``mkvmerge -J <file>`` answers with the identification stored under the file's path
+    in the yielded dict, with ``file_name`` and a supported ``container`` filled in.
+    """
+    identifications: dict[str, dict[str, Any]] = {}
+
+    def check_output(cmd: list[str]) -> bytes:
+        if "-V" in cmd:
+            return b"mkvmerge v90.0"
+        info = {"file_name": cmd[-1], "container": {"supported": True}, **identifications[cmd[-1]]}
+        return json.dumps(info).encode()
+
+    with patch("pymkv.Verifications.sp.check_output", side_effect=check_output):
+        yield identifications
+
+
 @pytest.fixture
 def temp_file(tmp_path: Path) -> str:
     file = tmp_path / "test_attachment.txt"
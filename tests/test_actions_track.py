@@ -208,3 +208,13 @@ def test_added_lang_in_track_and_mux_file(
     track.language_ietf = "TEST"
     with pytest.raises(ValueError):  # noqa: PT011
         mkv.mux(output_file)
+
+
+def test_batch_edits_reorders_once(get_path_test_file: Path, get_path_test_file_two: Path) -> None:
+    mkv = MKVFile(get_path_test_file)
+    with mkv.batch_edits():
+        mkv.add_track(MKVTrack(str(get_path_test_file_two), track_id=1))
+        mkv.move_track_front(2)
+        assert [track.file_id for track in mkv.tracks] == [1, 0, 0]
+
+    assert [track.file_id for track in mkv.tracks] == [0, 1, 1]
@@ -23,6 +23,11 @@ def test_is_bcp47_empty() -> None:
     assert _test_is_bcp47("") is False
 
 
+def test_is_bcp47_warns_on_every_call() -> None:
+    assert _test_is_bcp47("de-DE") is True
+    assert _test_is_bcp47("de-DE") is True
+
+
 def _test_is_bcp47(language_ietf: str) -> bool:
     with pytest.deprecated_call():
         return BCP47.is_bcp47(language_ietf)
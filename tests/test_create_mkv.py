@@ -1,4 +1,9 @@
+import io
+import logging
 from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from pymkv import MKVFile, MKVTrack
 
@@ -16,3 +21,58 @@ def test_create_new_mkv(
 
     assert len(mkv.tracks) == 3  # noqa: PLR2004
     mkv.mux(output_file)
+
+
+def test_mkv_file_uses_slots() -> None:
+    mkv = MKVFile()
+
+    assert not hasattr(mkv, "__dict__")
+    assert "'tracks': []" in repr(mkv)
+
+
+def _mkvmerge_process(returncode: int, stderr: bytes) -> MagicMock:
+    proc = MagicMock()
+    proc.stderr = io.BytesIO(stderr)
+    proc.returncode = returncode
+    return proc
+
+
+@pytest.mark.parametrize("silent", [False, True])
+def test_mux_success(tmp_path: Path, caplog: pytest.LogCaptureFixture, silent: bool) -> None:
+    caplog.set_level(logging.DEBUG)
+    with patch("pymkv.MKVFile.verify_mkvmerge", return_value=True):
+        mkv = MKVFile()
+    with patch("pymkv.MKVFile.sp.Popen", return_value=_mkvmerge_process(0, b"Progress: 50%\nProgress: 100%\n")):
+        assert mkv.mux(tmp_path / "out.mkv", silent=silent) == 0
+
+    assert [record.getMessage() for record in caplog.records] == ([] if silent else ["Progress: 50%", "Progress: 100%"])
+
+
+def test_mux_ignored_warning(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    with patch("pymkv.MKVFile.verify_mkvmerge", return_value=True):
+        mkv = MKVFile()
+    with patch("pymkv.MKVFile.sp.Popen", return_value=_mkvmerge_process(1, b"Warning: something\n")):
+        assert mkv.mux(tmp_path / "out.mkv", silent=True, ignore_warning=True) == 1
+
+    assert [record.levelname for record in caplog.records] == ["WARNING"]
+    with (
+        patch("pymkv.MKVFile.sp.Popen", return_value=_mkvmerge_process(1, b"Warning: something\n")),
+        pytest.raises(ValueError, match="Warning: something"),
+    ):
+        mkv.mux(tmp_path / "out.mkv", silent=True)
+
+
+@pytest.mark.parametrize("silent", [False, True])
+def test_mux_failure_logs_output_as_error(tmp_path: Path, caplog: pytest.LogCaptureFixture, silent: bool) -> None:
+    caplog.set_level(logging.DEBUG)
+    with patch("pymkv.MKVFile.verify_mkvmerge", return_value=True):
+        mkv = MKVFile()
+    with (
+        patch("pymkv.MKVFile.sp.Popen", return_value=_mkvmerge_process(2, b"Error: broken\n")),
+        pytest.raises(ValueError, match="exit status 2") as excinfo,
+    ):
+        mkv.mux(tmp_path / "out.mkv", silent=silent)
+
+    assert "Error: broken" in str(excinfo.value)
+    errors = [record for record in caplog.records if record.levelno == logging.ERROR]
+    assert sum("Error: broken" in record.getMessage() for record in errors) == 1
@@ -1,6 +1,8 @@
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
-from pymkv import MKVFile
+from pymkv import MKVFile, MKVTrack
 
 
 def test_add_file(get_base_path: Path, get_path_test_file: Path) -> None:
@@ -9,3 +11,24 @@ def test_add_file(get_base_path: Path, get_path_test_file: Path) -> None:
     mkv.tracks[1].extract()
 
     assert output_file.is_file()
+
+
+def test_extract_many_runs_mkvextract_once_per_file(tmp_path: Path, fake_mkvmerge: dict[str, Any]) -> None:
+    mkv_file = tmp_path / "file.mkv"
+    mkv_file.write_bytes(b"")
+    fake_mkvmerge[str(mkv_file)] = {
+        "tracks": [{"codec": "AVC/H.264/MPEG-4p10", "type": "video"}, {"codec": "AAC", "type": "audio"}],
+    }
+    tracks = MKVTrack.from_mkv(str(mkv_file))
+    with patch("pymkv.MKVTrack.sp.run") as mock_run:
+        output_paths = MKVTrack.extract_many(tracks, tmp_path)
+
+    assert output_paths == [str(tmp_path / "file.mkv_[0].mp4"), str(tmp_path / "file.mkv_[1].aac")]
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0] == [
+        "mkvextract",
+        "tracks",
+        str(mkv_file),
+        f"0:{output_paths[0]}",
+        f"1:{output_paths[1]}",
+    ]
@@ -17,3 +17,13 @@ def test_is_iso639_2_non_str_input() -> None:
 
 def test_is_iso639_2_empty_string() -> None:
     assert is_iso639_2("") is False
+
+
+def test_is_iso639_2_bibliographic_only() -> None:
+    assert is_iso639_2("ger") is True
+    assert is_iso639_2("deu") is False
+
+
+def test_is_iso639_2_surrounding_whitespace() -> None:
+    assert is_iso639_2(" eng") is True
+    assert is_iso639_2("eng ") is True
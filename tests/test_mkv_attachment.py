@@ -51,6 +51,13 @@ def test_repr(temp_file: str) -> None:
     assert "mime_type" in repr_str
 
 
+def test_slots(temp_file: str) -> None:
+    attachment = MKVAttachment(temp_file)
+    assert not hasattr(attachment, "__dict__")
+    with pytest.raises(AttributeError):
+        attachment.unknown = True  # type: ignore[attr-defined]
+
+
 def test_mime_type_guess(tmp_path: Path) -> None:
     # Test different file types
     file_types = {
@@ -78,3 +85,29 @@ def test_file_path_expansion(tmp_path: Path, monkeypatch) -> None:  # noqa: ANN0
 
     attachment = MKVAttachment("~/test_file.txt")
     assert attachment.file_path == str(test_file)
+
+
+def test_mime_type_guess_case_insensitive(tmp_path: Path) -> None:
+    for file_name in ("lower.jpg", "UPPER.JPG"):
+        file_path = tmp_path / file_name
+        file_path.write_text("Test content")
+        assert MKVAttachment(str(file_path)).mime_type == "image/jpeg"
+
+
+def test_init_with_mime_type(temp_file: str) -> None:
+    attachment = MKVAttachment(temp_file, mime_type="application/x-truetype-font")
+    assert attachment.file_path == temp_file
+    assert attachment.mime_type == "application/x-truetype-font"
+
+
+def test_init_with_mime_type_invalid_path() -> None:
+    with pytest.raises(FileNotFoundError):
+        MKVAttachment("non_existent_file.ttf", mime_type="application/x-truetype-font")
+
+
+def test_mime_type_guess_compound_suffix(tmp_path: Path) -> None:
+    for file_name in ("archive.tar.gz", "archive.tar.xz", "notes.v2.txt"):
+        (tmp_path / file_name).write_text("Test content")
+    assert MKVAttachment(str(tmp_path / "archive.tar.gz")).mime_type == "application/x-tar"
+    assert MKVAttachment(str(tmp_path / "archive.tar.xz")).mime_type == "application/x-tar"
+    assert MKVAttachment(str(tmp_path / "notes.v2.txt")).mime_type == "text/plain"
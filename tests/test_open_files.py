@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -57,3 +58,59 @@ def test_verify_mkvmerge_in_mkv_file() -> None:
         match="mkvmerge is not at the specified path, add it there or changed mkvmerge_path property",
     ):
         MKVFile(title="test", mkvmerge_path="mkvmerge_test")
+
+
+def test_open_many(get_path_test_file: Path, get_path_test_file_two: Path) -> None:
+    mkvs = MKVFile.open_many([get_path_test_file, get_path_test_file_two])
+
+    assert [mkv.tracks[0].file_path for mkv in mkvs] == [str(get_path_test_file), str(get_path_test_file_two)]
+
+
+def test_open_many_empty() -> None:
+    assert MKVFile.open_many([]) == []
+
+
+def test_track_from_mkv(get_path_test_file: Path) -> None:
+    tracks = MKVTrack.from_mkv(str(get_path_test_file))
+
+    assert [track.track_id for track in tracks] == [0, 1]
+    assert MKVTrack.from_mkv(str(get_path_test_file), track_ids=[1])[0].track_id == 1
+
+
+def test_track_ignores_existing_info_of_other_file(tmp_path: Path, fake_mkvmerge: dict[str, Any]) -> None:
+    track_file = tmp_path / "track.aac"
+    track_file.write_bytes(b"")
+    other_info = {"file_name": str(tmp_path / "other.mkv"), "tracks": [{"codec": "AVC", "type": "video"}]}
+    fake_mkvmerge[str(track_file)] = {"tracks": [{"codec": "AAC", "type": "audio"}]}
+
+    track = MKVTrack(str(track_file), existing_info=other_info)
+
+    assert track.track_codec == "AAC"
+    assert track.track_type == "audio"
+
+
+def test_track_uses_slots(tmp_path: Path, fake_mkvmerge: dict[str, Any]) -> None:
+    track_file = tmp_path / "track.aac"
+    track_file.write_bytes(b"")
+    fake_mkvmerge[str(track_file)] = {"tracks": [{"codec": "AAC", "type": "audio"}]}
+
+    track = MKVTrack(str(track_file))
+
+    assert not hasattr(track, "__dict__")
+    assert "_info_json" not in repr(track)
+
+
+def test_track_load_many(tmp_path: Path, fake_mkvmerge: dict[str, Any]) -> None:
+    file_paths = [tmp_path / "first.mkv", tmp_path / "second.mkv"]
+    for track_count, file_path in enumerate(file_paths, start=1):
+        file_path.write_bytes(b"")
+        fake_mkvmerge[str(file_path)] = {"tracks": [{"codec": "AAC", "type": "audio"}] * track_count}
+
+    loaded = MKVTrack.load_many([str(file_path) for file_path in file_paths])
+
+    assert [[track.file_path for track in tracks] for tracks in loaded] == [
+        [str(file_paths[0])],
+        [str(file_paths[1])] * 2,
+    ]
+    assert [track.track_id for track in loaded[1]] == [0, 1]
+    assert MKVTrack.load_many([]) == []
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from pymkv import MKVFile, Timestamp
+
+
+@pytest.fixture
+def mkv(tmp_path: Path, fake_mkvmerge: dict[str, Any]) -> MKVFile:
+    file_path = tmp_path / "file.mkv"
+    file_path.write_bytes(b"")
+    fake_mkvmerge[str(file_path)] = {
+        "container": {"supported": True, "properties": {}},
+        "tracks": [
+            {"id": 0, "codec": "HEVC", "type": "video", "properties": {}},
+            {"id": 1, "codec": "AAC", "type": "audio", "properties": {}},
+            {"id": 2, "codec": "SubRip/SRT", "type": "subtitles", "properties": {}},
+        ],
+    }
+    return MKVFile(str(file_path))
+
+
+def _split_args(mkv: MKVFile) -> list[str]:
+    command = cast(list[str], mkv.command("out.mkv", subprocess=True))
+    return command[command.index("--split") :] if "--split" in command else []
+
+
+@pytest.mark.parametrize(
+    ("split", "expected"),
+    [
+        (lambda mkv: mkv.split_timestamps("00:01", 120), ["--split", "timestamps:00:01,02:00"]),
+        (
+            lambda mkv: mkv.split_timestamps("00:01", 120, ["00:03:00.5"], link=True),
+            ["--split", "timestamps:00:01,02:00,03:00.5", "--link"],
+        ),
+        (
+            lambda mkv: mkv.split_timestamps(Timestamp("00:00:10"), [Timestamp(75), ["01:00:00.000000001"]]),
+            ["--split", "timestamps:00:10,01:15,01:00:00.000000001"],
+        ),
+        (lambda mkv: mkv.split_frames(1, [2, 3]), ["--split", "frames:1,2,3"]),
+        (lambda mkv: mkv.split_frames([[4], (5, [6])], link=True), ["--split", "frames:4,5,6", "--link"]),
+        (
+            lambda mkv: mkv.split_timestamp_parts([["00:01", "00:02"], ["00:03", "00:04", "00:05", "00:06"]]),
+            ["--split", "parts:00:01-00:02,00:03-00:04,+00:05-00:06"],
+        ),
+        (
+            lambda mkv: mkv.split_timestamp_parts([[None, "00:02"], ["00:03", None]], link=True),
+            ["--split", "parts:-00:02,00:03-", "--link"],
+        ),
+        (
+            lambda mkv: mkv.split_timestamp_parts([[Timestamp(1), 2]]),
+            ["--split", "parts:00:01-00:02"],
+        ),
+        (
+            lambda mkv: mkv.split_parts_frames([[1, 2], [3, 4, 5, 6]]),
+            ["--split", "parts:1-2,3-4,+5-6"],
+        ),
+        (
+            lambda mkv: mkv.split_parts_frames([[None, 2], (3, None)], link=True),
+            ["--split", "parts:-2,3-", "--link"],
+        ),
+        (lambda mkv: mkv.split_chapters(), ["--split", "chapters:all"]),
+        (lambda mkv: mkv.split_chapters(1, [2, 3], link=True), ["--split", "chapters:1,2,3", "--link"]),
+        (lambda mkv: mkv.split_size(1000), ["--split", "size:1000"]),
+        (lambda mkv: mkv.split_duration("01:00", link=True), ["--split", "duration:01:00", "--link"]),
+    ],
+)
+def test_split_command(mkv: MKVFile, split: Callable[[MKVFile], None], expected: list[str]) -> None:
+    split(mkv)
+    assert _split_args(mkv) == expected
+
+    mkv.split_none()
+    assert _split_args(mkv) == []
+
+
+@pytest.mark.parametrize(
+    ("split", "error"),
+    [
+        (lambda mkv: mkv.split_timestamps("00:02", "00:01"), ValueError),
+        (lambda mkv: mkv.split_timestamps("00:01", "00:01"), ValueError),
+        (lambda mkv: mkv.split_frames(2, 1), ValueError),
+        (lambda mkv: mkv.split_frames("a"), TypeError),
+        (lambda mkv: mkv.split_chapters(0), ValueError),
+        (lambda mkv: mkv.split_chapters(2, 2), ValueError),
+        (lambda mkv: mkv.split_timestamp_parts([["00:01"]]), ValueError),
+        (lambda mkv: mkv.split_timestamp_parts([["00:01", None, "00:03", "00:04"]]), ValueError),
+        (lambda mkv: mkv.split_timestamp_parts([["00:02", "00:01"]]), ValueError),
+        (lambda mkv: mkv.split_parts_frames([[1, 2, 3]]), ValueError),
+        (lambda mkv: mkv.split_parts_frames([[2, 1]]), ValueError),
+        (lambda mkv: mkv.split_parts_frames([[1, "x"]]), TypeError),
+    ],
+)
+def test_split_errors(mkv: MKVFile, split: Callable[[MKVFile], None], error: type[Exception]) -> None:
+    with pytest.raises(error):
+        split(mkv)
+
+
+@pytest.mark.parametrize(
+    ("track_ids", "exclusive", "expected"),
+    [
+        ((1, 2), False, [True, False, False]),
+        (([0, [2]],), False, [False, True, False]),
+        ((1,), True, [False, True, False]),
+        (((0, 2),), True, [True, False, True]),
+    ],
+)
+def test_track_tags_command(
+    mkv: MKVFile,
+    track_ids: tuple[Any, ...],
+    exclusive: bool,
+    expected: list[bool],
+) -> None:
+    mkv.track_tags(*track_ids, exclusive=exclusive)
+
+    assert [track.no_track_tags for track in mkv.tracks] == expected
+    command = mkv.command("out.mkv", subprocess=True)
+    assert command.count("--no-track-tags") == expected.count(True)
+
+
+@pytest.mark.parametrize(
+    ("track_ids", "error"),
+    [((3,), IndexError), ((-1,), IndexError), (("1",), TypeError), ((), ValueError)],
+)
+def test_track_tags_errors(mkv: MKVFile, track_ids: tuple[Any, ...], error: type[Exception]) -> None:
+    with pytest.raises(error):
+        mkv.track_tags(*track_ids)
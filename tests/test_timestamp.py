@@ -37,6 +37,17 @@ def test_properties() -> None:
     assert ts.nn == 789000000  # noqa: PLR2004
 
 
+def test_nanoseconds_are_exact() -> None:
+    assert Timestamp("00:00.062998929").nn == 62998929  # noqa: PLR2004
+    assert Timestamp("1:2:3.000000001").nn == 1
+    assert Timestamp("05:06").nn == 0
+
+
+def test_trailing_newline() -> None:
+    ts = Timestamp("01:02.5\n")
+    assert (ts.mm, ts.ss, ts.nn) == (1, 2, 500000000)
+
+
 def test_setters() -> None:
     ts = Timestamp()
     ts.hh = 10
@@ -71,7 +82,7 @@ def test_getitem() -> None:
     assert ts[0] == 1  # hours
     assert ts[1] == 23  # minutes  # noqa: PLR2004
     assert ts[2] == 45  # seconds  # noqa: PLR2004
-    assert ts[3] == 45  # seconds (again, as per the implementation)  # noqa: PLR2004
+    assert ts[3] == 678000000  # nanoseconds  # noqa: PLR2004
 
 
 def test_invalid_input() -> None:
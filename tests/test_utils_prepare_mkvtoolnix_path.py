@@ -7,6 +7,11 @@ import pytest
 from pymkv import utils
 
 
+@pytest.fixture(autouse=True)
+def _clear_prepare_path_cache() -> None:
+    utils._shlex_split.cache_clear()  # noqa: SLF001
+
+
 def test_prepare_mkvmerge_path_with_string() -> None:
     result = utils.prepare_mkvtoolnix_path(
         "flatpak run org.bunkus.mkvtoolnix-gui mkvmerge",
@@ -41,6 +46,20 @@ def test_prepare_mkvmerge_path_with_nonexistent_path() -> None:
     assert result == ("/nonexistent/path", "with", "spaces/mkvmerge")
 
 
+def test_prepare_mkvmerge_path_checks_existence_every_call(tmp_path: Path) -> None:
+    path = str(tmp_path / "dir with space" / "mkvmerge")
+    assert utils.prepare_mkvtoolnix_path(path) != (path,)
+
+    (tmp_path / "dir with space").mkdir()
+    (tmp_path / "dir with space" / "mkvmerge").touch()
+    assert utils.prepare_mkvtoolnix_path(path) == (path,)
+
+
+def test_prepare_mkvmerge_path_with_string_is_cached() -> None:
+    path = "flatpak run org.bunkus.mkvtoolnix-gui mkvmerge"
+    assert utils.prepare_mkvtoolnix_path(path) is utils.prepare_mkvtoolnix_path(path)
+
+
 def test_prepare_mkvmerge_path_with_list() -> None:
     result = utils.prepare_mkvtoolnix_path(["mkvmerge", "path"])
     assert result == ("mkvmerge", "path")
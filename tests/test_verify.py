@@ -1,16 +1,14 @@
 from __future__ import annotations
 
+import os
 import subprocess as sp
 from pathlib import Path
-from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 
-from pymkv import verify_matroska
-
-if TYPE_CHECKING:
-    import os
+from pymkv import verify_matroska, verify_mkvmerge, verify_supported
+from pymkv.Verifications import checking_file_path, get_cached_file_info
 
 
 def test_verify_matroska_true(get_path_test_file: Path) -> None:
@@ -86,3 +84,66 @@ def test_verify_matroska_mkvmerge_not_found_various_types() -> None:
             match="mkvmerge is not at the specified path",
         ):
             verify_matroska("test.mkv", "non_existent_path")
+
+
+def test_get_cached_file_info_runs_mkvmerge_once(tmp_path: Path) -> None:
+    file_path = tmp_path / "file.mkv"
+    file_path.write_bytes(b"")
+    with patch("pymkv.Verifications.sp.check_output") as mock_check_output:
+        mock_check_output.return_value = b'{"container": {"supported": true}}'
+        first = get_cached_file_info(file_path, "mkvmerge")
+        second = get_cached_file_info(str(file_path), ("mkvmerge",))
+        assert first is second
+        assert mock_check_output.call_count == 1
+
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        get_cached_file_info(file_path, "mkvmerge")
+        assert mock_check_output.call_count == 2  # noqa: PLR2004
+
+        # a rewrite that keeps the modification time but changes the size is probed again too
+        stat = file_path.stat()
+        file_path.write_bytes(b"\x1a\x45\xdf\xa3")
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        get_cached_file_info(file_path, "mkvmerge")
+        assert mock_check_output.call_count == 3  # noqa: PLR2004
+
+        # so is a file moved over it that has the same size and modification time
+        stat = file_path.stat()
+        replacement = tmp_path / "replacement.mkv"
+        replacement.write_bytes(b"\x1a\x45\xdf\xa3")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, file_path)  # noqa: PTH105
+        get_cached_file_info(file_path, "mkvmerge")
+        assert mock_check_output.call_count == 4  # noqa: PLR2004
+
+
+def test_verify_mkvmerge_runs_mkvmerge_once() -> None:
+    with patch("pymkv.Verifications.sp.check_output") as mock_check_output:
+        mock_check_output.return_value = b"mkvmerge v90.0"
+        assert verify_mkvmerge("mkvmerge") is True
+        assert verify_mkvmerge(["mkvmerge"]) is True
+        assert mock_check_output.call_count == 1
+
+
+def test_verify_mkvmerge_checks_again_after_failure() -> None:
+    with patch("pymkv.Verifications.sp.check_output") as mock_check_output:
+        mock_check_output.side_effect = FileNotFoundError
+        assert verify_mkvmerge("mkvmerge") is False
+        mock_check_output.side_effect = None
+        mock_check_output.return_value = b"mkvmerge v90.0"
+        assert verify_mkvmerge("mkvmerge") is True
+        assert mock_check_output.call_count == 2  # noqa: PLR2004
+
+
+def test_checking_file_path_expands_user(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    file = tmp_path / "file.mkv"
+    file.touch()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert checking_file_path("~/file.mkv") == str(file)
+
+
+def test_verify_supported_uses_given_info() -> None:
+    with patch("pymkv.Verifications.sp.check_output") as mock_check_output:
+        assert verify_supported("missing.mkv", info_json={"container": {"supported": True}}) is True
+        mock_check_output.assert_not_called()